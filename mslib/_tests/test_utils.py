@@ -29,6 +29,9 @@ import pytest
 import os
 import fs
 import datetime
+import numpy as np
+from scipy.interpolate import interp1d
+from scipy.ndimage import map_coordinates
 from mslib import utils
 import multidict
 import werkzeug
@@ -179,6 +182,24 @@ class TestConfigLoader(object):
         with pytest.raises(KeyError):
             assert utils.config_loader(config_file=config_file, dataset="UNDEFINED")
 
+    def test_changed_config_file(self):
+        """
+        the cached content of a config file is not shared with callers and renewed when the file changes
+        """
+        with fs.open_fs(MSS_CONFIG_PATH) as file_dir:
+            config_files = [fs.path.combine(MSS_CONFIG_PATH, "mss_settings.json"),
+                            file_dir.getsyspath("mss_settings.json")]
+        for config_file in config_files:
+            create_mss_settings_file('{"num_labels": 20, "locations": {"A": [1, 2]}}')
+            locations = utils.config_loader(config_file=config_file, dataset="locations")
+            locations["B"] = [3, 4]
+            assert utils.config_loader(config_file=config_file, dataset="locations") == {"A": [1, 2]}
+            utils.config_loader(config_file=config_file)["locations"]["C"] = [5, 6]
+            assert utils.read_config_file(config_file)["locations"] == {"A": [1, 2]}
+            assert utils.config_loader(config_file=config_file, dataset="num_labels") == 20
+            create_mss_settings_file('{"num_labels": 5}')
+            assert utils.config_loader(config_file=config_file, dataset="num_labels") == 5
+
 
 class TestGetDistance(object):
     """
@@ -192,6 +213,12 @@ class TestGetDistance(object):
         for coord1, coord2, distance in coordinates_distance:
             assert int(utils.get_distance(coord1, coord2)) == distance
 
+    def test_get_distance_arrays(self):
+        coords1 = np.array([(50.355136, 7.566077), (-5.135943, -42.792442)])
+        coords2 = np.array([(50.353968, 4.577915), (4.606085, 120.028077)])
+        assert list(utils.get_distance(coords1, coords2).astype(int)) == [212, 18130]
+        assert list(utils.get_distance(coords1[0], coords2).astype(int)) == [212, 11176]
+
     def test_find_location(self):
         assert utils.find_location(50.92, 6.36) == ((50.92, 6.36), 'Juelich')
         assert utils.find_location(50.9200002, 6.36) == ((50.92, 6.36), 'Juelich')
@@ -199,6 +226,8 @@ class TestGetDistance(object):
 
 class TestProjections(object):
     def test_get_projection_params(self):
+        assert utils.get_projection_params("epsg:4839") == {'basemap': {'epsg': '4839'}, 'bbox': 'meter(10.5,51)'}
+        utils.get_projection_params("EPSG:4839")["basemap"]["epsg"] = "4326"
         assert utils.get_projection_params("epsg:4839") == {'basemap': {'epsg': '4839'}, 'bbox': 'meter(10.5,51)'}
         with pytest.raises(ValueError):
             utils.get_projection_params('auto2:42005')
@@ -218,16 +247,31 @@ class TestTimes(object):
         assert utils.datetime_to_jsec(datetime.datetime(2000, 1, 1, 0, 0, 0, 0)) == 0
         assert utils.datetime_to_jsec(datetime.datetime(1995, 1, 1, 0, 0, 0, 0)) == -157766400.0
 
+    def test_datetime_array_to_jsec(self):
+        jsecs = utils.datetime_array_to_jsec([datetime.datetime(2000, 2, 1, 0, 0, 0, 0),
+                                             datetime.datetime(2000, 1, 1, 0, 0, 0, 500000),
+                                             datetime.datetime(1995, 1, 1, 0, 0, 0, 0)])
+        assert list(jsecs) == [2678400.0, 0.5, -157766400.0]
+
     def test_jsec_to_datetime(self):
         assert utils.jsec_to_datetime(0) == datetime.datetime(2000, 1, 1, 0, 0, 0, 0)
         assert utils.jsec_to_datetime(3600) == datetime.datetime(2000, 1, 1, 1, 0, 0, 0)
         assert utils.jsec_to_datetime(-157766400.0) == datetime.datetime(1995, 1, 1, 0, 0, 0, 0)
 
+    def test_jsec_array_to_datetime(self):
+        dts = utils.jsec_array_to_datetime([0, 3600.5, -157766400.0])
+        assert list(dts.astype(datetime.datetime)) == [
+            datetime.datetime(2000, 1, 1, 0, 0, 0, 0),
+            datetime.datetime(2000, 1, 1, 1, 0, 0, 500000),
+            datetime.datetime(1995, 1, 1, 0, 0, 0, 0)]
+
     def test_compute_hour_of_day(self):
         assert utils.compute_hour_of_day(0) == 0
         assert utils.compute_hour_of_day(86400) == 0
         assert utils.compute_hour_of_day(3600) == 1
         assert utils.compute_hour_of_day(82800) == 23
+        assert utils.compute_hour_of_day(-5400) == 22.5
+        assert list(utils.compute_hour_of_day(np.array([0, 3600, 86400 + 1800]))) == [0, 1, 0.5]
 
 
 class TestAngles(object):
@@ -243,6 +287,9 @@ class TestAngles(object):
         assert utils.fix_angle(-180) == 180
         assert utils.fix_angle(-181) == 179
         assert utils.fix_angle(420) == 60
+        assert utils.fix_angle(360) == 0
+        assert utils.fix_angle(-3590.5) == 9.5
+        assert list(utils.fix_angle(np.array([-90, 420]))) == [270, 60]
 
     def test_rotate_point(self):
         assert utils.rotate_point([0, 0], 0) == (0.0, 0.0)
@@ -250,11 +297,23 @@ class TestAngles(object):
         assert utils.rotate_point([1, 0], 0) == (1.0, 0.0)
         assert utils.rotate_point([100, 90], 90) == (-90, 100)
 
+    def test_rotate_points(self):
+        points = [[0, 0], [1, 0], [100, 90]]
+        for angle in (0, 90, -33.3):
+            rotated = utils.rotate_points(points, angle, origin=(1, 2))
+            assert rotated.shape == (3, 2)
+            assert np.allclose(rotated, [utils.rotate_point(point, angle, origin=(1, 2)) for point in points])
+        assert utils.rotate_points([], 90).shape == (0, 2)
+
 
 class TestConverter(object):
     def test_convert_pressure_to_altitude(self):
         assert utils.convertHPAToKM(1013.25) == 0
         assert int(utils.convertHPAToKM(25) * 1000) == 22415
+        heights = utils.convertHPAToKM(np.ma.masked_equal([1013.25, 25, -999.], -999.))
+        assert isinstance(heights, np.ma.MaskedArray)
+        assert heights.mask.tolist() == [False, False, True]
+        assert np.allclose(heights[:2], [0, utils.convertHPAToKM(25)])
 
     def test_convert_pressure_to_vertical_axis_measure(self):
         assert utils.convert_pressure_to_vertical_axis_measure('pressure', 10000) == 100
@@ -262,6 +321,67 @@ class TestConverter(object):
         assert utils.convert_pressure_to_vertical_axis_measure('pressure altitude', 75000) == 2.4668986099864068
 
 
+class TestInterpolateVertsec(object):
+    def setup(self):
+        self.lats = np.array([60., 55., 50., 45., 40.])
+        self.lons = np.array([-10., 0., 5., 15.])
+        levels = np.arange(3)[:, np.newaxis, np.newaxis]
+        # a field linear in lat and lon is reproduced exactly by bilinear interpolation
+        self.data = np.ma.masked_array(
+            100. * levels + 2. * self.lats[np.newaxis, :, np.newaxis] + 0.5 * self.lons[np.newaxis, np.newaxis, :])
+
+    def test_linear_field(self):
+        lats = np.array([40., 42.5, 51., 60.])
+        lons = np.array([-10., 2.5, 14., 15.])
+        curtain = utils.interpolate_vertsec(self.data, self.lats, self.lons, lats, lons)
+        assert curtain.shape == (3, 4)
+        assert not np.ma.is_masked(curtain)
+        expected = 100. * np.arange(3)[:, np.newaxis] + 2. * lats + 0.5 * lons
+        assert np.allclose(curtain, expected)
+        interpolator = utils.BilinearCurtainInterpolator(self.lats, self.lons, lats, lons)
+        assert np.allclose(interpolator(self.data), expected)
+        assert np.allclose(interpolator(2 * self.data), 2 * expected)
+
+    def test_outside_grid(self):
+        curtain = utils.interpolate_vertsec(self.data, self.lats, self.lons,
+                                            np.array([50., 70., 50.]), np.array([0., 0., 20.]))
+        assert not np.ma.is_masked(curtain[:, 0])
+        assert curtain.mask[:, 1:].all()
+
+    def test_masked_data(self):
+        self.data[1, 2, 1] = np.ma.masked
+        curtain = utils.interpolate_vertsec(self.data, self.lats, self.lons,
+                                            np.array([52.5, 42.5]), np.array([2.5, 2.5]))
+        assert curtain.mask[1, 0]
+        assert not curtain.mask[0, 0]
+        assert not curtain.mask[:, 1].any()
+
+    def test_single_precision(self):
+        lats, lons = np.array([41., 52.5, 59.]), np.array([-9., 2.5, 14.])
+        curtain = utils.interpolate_vertsec(self.data.astype(np.float32), self.lats, self.lons, lats, lons)
+        assert curtain.dtype == np.float32
+        assert np.allclose(curtain, utils.interpolate_vertsec(self.data, self.lats, self.lons, lats, lons))
+
+    def test_constant_double_precision(self):
+        data = np.ma.masked_array(np.full(self.data.shape, 101325.))
+        curtain = utils.interpolate_vertsec(data, self.lats, self.lons,
+                                            np.linspace(41., 59., 25), np.linspace(14., -9., 25))
+        assert curtain.dtype == np.float64
+        assert (curtain == 101325.).all()
+
+    def test_map_coordinates_reference(self):
+        data = np.ma.masked_array(np.random.default_rng(0).random(self.data.shape))
+        lats = np.linspace(41., 59., 25)
+        lons = np.linspace(14., -9., 25)
+        curtain = utils.interpolate_vertsec(data, self.lats, self.lons, lats, lons)
+        # single call on the 3-D volume, the level coordinate is the identity
+        ind_lats = interp1d(self.lats, np.arange(len(self.lats)))(lats)
+        ind_lons = interp1d(self.lons, np.arange(len(self.lons)))(lons)
+        coords = np.broadcast_arrays(np.arange(data.shape[0])[:, np.newaxis], ind_lats, ind_lons)
+        expected = map_coordinates(data.filled(np.nan), coords, order=1)
+        assert np.allclose(curtain, expected)
+
+
 class TestLatLonPoints(object):
     def test_linear(self):
         ref_times = [datetime.datetime(2012, 7, 12, 10, 30), datetime.datetime(2012, 7, 12, 10, 35)]
@@ -27,11 +27,41 @@
 
 import os
 import sys
+from datetime import datetime
 import mock
+import numpy as np
 from PyQt5 import QtWidgets, QtCore, QtTest
+from mslib._tests.constants import ROOT_DIR
 import mslib.msui.satellite_dockwidget as sd
 
 
+# A segment ends with the first point after a gap of at least ten minutes, this
+# point is skipped. The point after two back-to-back gaps starts a new segment
+# and the last segment, which is not followed by a gap, is dropped. Missing
+# longitudes are negated to 999. before masking, so only their latitudes are masked.
+SWATH_PREDICTION = """2017/01/27 Orbital Tracks
+   GMT      SUBLAT    SUBLON  HEADING    LEFTLAT   LEFTLON  RIGHTLAT  RIGHTLON
+00:00:00   33.3741  -31.5336  -999.00   33.0000  -30.0000   33.5000  -33.0000
+00:00:20   32.1739  -31.2049   192.88  -999.0000 -999.0000   32.5000  -32.5000
+00:00:40   30.9730  -30.8826   192.79   30.5000  -29.5000   31.0000  -32.0000
+00:20:00   10.0000  -20.0000   190.00   10.0000  -19.0000   10.0000  -21.0000
+00:20:20    9.0000  -19.5000   190.00    9.0000  -18.5000    9.0000  -20.5000
+00:40:00    0.0000  -10.0000   180.00    0.0000   -9.0000    0.0000  -11.0000
+01:00:00  -10.0000   -5.0000   170.00  -10.0000   -4.0000  -10.0000   -6.0000
+01:00:20  -11.0000   -4.5000   170.00  -11.0000   -3.5000  -11.0000   -5.5000
+01:00:40 -999.0000 -999.0000  -999.00  -12.0000   -3.0000  -12.0000   -5.0000
+01:30:00  -20.0000    0.0000   160.00  -20.0000    1.0000  -20.0000   -1.0000
+01:30:20  -21.0000    0.5000   160.00  -21.0000    1.5000  -21.0000   -0.5000
+"""
+
+NO_SWATH_PREDICTION = """2017/01/28 Orbital Tracks
+   GMT      SUBLAT    SUBLON  HEADING
+23:40:00   33.3741  -31.5336  -999.00
+23:40:20   32.1739  -31.2049   192.88
+23:55:00   30.9730  -30.8826   192.79
+"""
+
+
 class Test_SatelliteDockWidget(object):
     def setup(self):
         self.application = QtWidgets.QApplication(sys.argv)
@@ -61,3 +91,47 @@ class Test_SatelliteDockWidget(object):
         QtWidgets.QApplication.processEvents()
         assert self.view.plot_satellite_overpass.call_count == 2
         self.view.reset_mock()
+
+
+class Test_ReadNasaSatellitePrediction(object):
+    def read(self, content):
+        fname = os.path.join(ROOT_DIR, "satellite_prediction.txt")
+        with open(fname, "w") as predfile:
+            predfile.write(content)
+        return sd.read_nasa_satellite_prediction(fname)
+
+    def test_segments(self):
+        segments = self.read(SWATH_PREDICTION)
+        assert len(segments) == 3
+        assert [len(segment["utc"]) for segment in segments] == [3, 1, 3]
+        assert list(segments[0]["utc"]) == [datetime(2017, 1, 27, 0, 0, _s) for _s in (0, 20, 40)]
+        assert list(segments[1]["utc"]) == [datetime(2017, 1, 27, 0, 20, 20)]
+        assert list(segments[2]["utc"]) == [datetime(2017, 1, 27, 1, 0, _s) for _s in (0, 20, 40)]
+        for segment in segments:
+            for key in ["satpos", "heading", "swath_left", "swath_right"]:
+                assert isinstance(segment[key], np.ma.MaskedArray)
+                assert len(segment[key]) == len(segment["utc"])
+
+        first, second, third = segments
+        assert np.allclose(first["satpos"][1], [31.2049, 32.1739])
+        assert np.allclose(second["swath_right"], [[20.5, 9.]])
+        assert first["heading"].mask.tolist() == [True, False, False]
+        assert first["swath_left"].mask.tolist() == [[False, False], [False, True], [False, False]]
+        assert not np.ma.is_masked(first["swath_right"])
+        assert not np.ma.is_masked(second["heading"])
+        assert third["satpos"].mask.tolist() == [[False, False], [False, False], [False, True]]
+        assert third["heading"].mask.tolist() == [False, False, True]
+        assert np.allclose(third["swath_left"][2], [3., -12.])
+
+    def test_no_swath(self):
+        segments = self.read(NO_SWATH_PREDICTION)
+        assert len(segments) == 1
+        segment = segments[0]
+        assert list(segment["utc"]) == [datetime(2017, 1, 28, 23, 40, 0), datetime(2017, 1, 28, 23, 40, 20)]
+        assert np.allclose(segment["satpos"], [[31.5336, 33.3741], [31.2049, 32.1739]])
+        assert segment["heading"].mask.tolist() == [True, False]
+        assert np.allclose(segment["swath_left"], segment["satpos"])
+        assert np.allclose(segment["swath_right"], segment["satpos"])
+
+    def test_empty(self):
+        assert self.read("2017/01/27 Orbital Tracks\n   GMT      SUBLAT    SUBLON  HEADING\n") == []
@@ -37,7 +37,7 @@ import skyfield_data
 from mslib.msui.constants import MSS_CONFIG_PATH
 from PyQt5 import QtGui, QtWidgets
 from mslib.msui.mss_qt import ui_remotesensing_dockwidget as ui
-from mslib.utils import jsec_to_datetime, datetime_to_jsec, get_distance, rotate_point, fix_angle
+from mslib.utils import jsec_to_datetime, datetime_array_to_jsec, get_distance, rotate_points, fix_angle
 
 
 EARTH_RADIUS = 6371.
@@ -207,7 +207,7 @@ class RemoteSensingControlWidget(QtWidgets.QWidget, ui.Ui_RemoteSensingDockWidge
         # calculate distances and times
         body, difftype = solartype
 
-        times = [datetime_to_jsec(_wp_time) for _wp_time in wp_times]
+        times = datetime_array_to_jsec(wp_times)
         x, y = list(zip(*wp_vertices))
         wp_lons, wp_lats = bmap(x, y, inverse=True)
 
@@ -287,8 +287,8 @@ class RemoteSensingControlWidget(QtWidgets.QWidget, ui.Ui_RemoteSensingDockWidge
         direction = [(x1 - x0, y1 - y0) for x0, x1, y0, y1 in lins]
         direction = [(_x / np.hypot(_x, _y), _y / np.hypot(_x, _y))
                      for _x, _y in direction]
-        los = [rotate_point(point, -self.dsbObsAngleAzimuth.value()) for point in direction]
-        los.append(los[-1])
+        los = rotate_points(direction, -self.dsbObsAngleAzimuth.value())
+        los = np.vstack([los, los[-1]])
 
         if isinstance(flight_alt, (collections.abc.Sequence, np.ndarray)):
             dist = [(np.sqrt(max((EARTH_RADIUS + a) ** 2 - (EARTH_RADIUS + cut_height) ** 2, 0)) / 110.)
@@ -297,7 +297,7 @@ class RemoteSensingControlWidget(QtWidgets.QWidget, ui.Ui_RemoteSensingDockWidge
         else:
             dist = (np.sqrt((EARTH_RADIUS + flight_alt) ** 2 - (EARTH_RADIUS + cut_height) ** 2) / 110.)
 
-        tp_dir = (np.array(los).T * dist).T
+        tp_dir = (los.T * dist).T
 
         tps = [(x0 + tp_x, y0 + tp_y, y0) for
                ((x0, x1, y0, y1), (tp_x, tp_y)) in zip(lins, tp_dir)]
@@ -326,11 +326,11 @@ class RemoteSensingControlWidget(QtWidgets.QWidget, ui.Ui_RemoteSensingDockWidge
         direction = [(0.5 * (x0 + x1), 0.5 * (y0 + y1), x1 - x0, y1 - y0) for x0, x1, y0, y1 in lins]
         direction = [(_u, _v, _x / np.hypot(_x, _y), _y / np.hypot(_x, _y))
                      for _u, _v, _x, _y in direction]
-        los = [rotate_point(point[2:], -self.dsbObsAngleAzimuth.value()) for point in direction]
+        los = rotate_points([point[2:] for point in direction], -self.dsbObsAngleAzimuth.value())
 
         dist = 1.
 
-        tp_dir = (np.array(los).T * dist).T
+        tp_dir = (los.T * dist).T
 
         tps = [(x0, y0, x0 + tp_x, y0 + tp_y) for
                ((x0, y0, _, _), (tp_x, tp_y)) in zip(direction, tp_dir)]
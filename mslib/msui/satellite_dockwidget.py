@@ -67,46 +67,53 @@ def read_nasa_satellite_prediction(fname):
 
     # Determine the date from the first line.
     date = datetime.strptime(satlines[0].split()[0], "%Y/%m/%d")
-    basedate = datetime.strptime("", "")
 
-    # "result" will store the individual overpass segments.
-    result = []
-    segment = {"utc": [], "satpos": [], "heading": [],
-               "swath_left": [], "swath_right": []}
+    # Convert all numeric columns in one pass. Instruments without swath
+    # only provide position and heading.
+    datalines = satlines[2:]
+    if len(datalines) > 0:
+        values = np.loadtxt(datalines, usecols=range(1, len(datalines[0].split())), ndmin=2)
+    else:
+        values = np.empty((0, 3))
+    # The times of day (HH:MM:SS) are split directly, which is much faster than strptime.
+    utc = []
+    for line in datalines:
+        hours, minutes, seconds = line.split()[0].split(":")
+        utc.append(date + timedelta(hours=int(hours), minutes=int(minutes), seconds=int(seconds)))
+    utc = np.array(utc)
+    satpos = np.column_stack([-1. * values[:, 1], values[:, 0]])
+    heading = values[:, 2]
+    if values.shape[1] == 7:
+        swath_left = np.column_stack([-1. * values[:, 4], values[:, 3]])
+        swath_right = np.column_stack([-1. * values[:, 6], values[:, 5]])
+    else:
+        # TODO 20100504: workaround for instruments without swath
+        swath_left = swath_right = satpos
+
+    # Mask missing values once for the whole file, segments are slices of these arrays.
+    satpos = np.ma.masked_equal(satpos, -999.)
+    heading = np.ma.masked_equal(heading, -999.)
+    swath_left = np.ma.masked_equal(swath_left, -999.)
+    swath_right = np.ma.masked_equal(swath_right, -999.)
 
     # Define a time difference that specifies when to start a new segment.
     # If the time between to subsequent points in the file is larger than
     # this time, a new segment will be started.
     seg_diff_time = timedelta(minutes=10)
 
-    # Loop over data lines. Either append point to current segment or start
-    # new segment. Before storing segments to the "result" list, convert
-    # to masked arrays.
-    for line in satlines[2:]:
-        values = line.split()
-        time = date + (datetime.strptime(values[0], "%H:%M:%S") - basedate)
-
-        if len(segment["utc"]) == 0 or (time - segment["utc"][-1]) < seg_diff_time:
-            segment["utc"].append(time)
-            segment["satpos"].append([-1. * float(values[2]), float(values[1])])
-            segment["heading"].append(float(values[3]))
-            if len(values) == 8:
-                segment["swath_left"].append([-1. * float(values[5]), float(values[4])])
-                segment["swath_right"].append([-1. * float(values[7]), float(values[6])])
-            else:
-                # TODO 20100504: workaround for instruments without swath
-                segment["swath_left"].append([-1. * float(values[2]), float(values[1])])
-                segment["swath_right"].append([-1. * float(values[2]), float(values[1])])
-
-        else:
-            segment["utc"] = np.array(segment["utc"])
-            segment["satpos"] = np.ma.masked_equal(segment["satpos"], -999.)
-            segment["heading"] = np.ma.masked_equal(segment["heading"], -999.)
-            segment["swath_left"] = np.ma.masked_equal(segment["swath_left"], -999.)
-            segment["swath_right"] = np.ma.masked_equal(segment["swath_right"], -999.)
-            result.append(segment)
-            segment = {"utc": [], "satpos": [], "heading": [],
-                       "swath_left": [], "swath_right": []}
+    # "result" will store the individual overpass segments. A segment is
+    # completed by the first point following it after more than seg_diff_time,
+    # this point is skipped and the next point starts the following segment.
+    result = []
+    start = 0
+    for stop in np.nonzero(np.diff(utc) >= seg_diff_time)[0] + 1:
+        if stop > start:
+            result.append({"utc": utc[start:stop],
+                           "satpos": satpos[start:stop],
+                           "heading": heading[start:stop],
+                           "swath_left": swath_left[start:stop],
+                           "swath_right": swath_right[start:stop]})
+            start = stop + 1
 
     return result
 
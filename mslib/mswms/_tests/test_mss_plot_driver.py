@@ -81,6 +81,19 @@ class Test_VSec(object):
         img = self.plot(mpl_vsec_styles.VS_TemperatureStyle_01(driver=self.vsec))
         assert img is not None
 
+    def test_curtain_interpolator_reuse(self):
+        img = self.plot(mpl_vsec_styles.VS_TemperatureStyle_01(driver=self.vsec))
+        assert img is not None
+        interpolator = self.vsec._curtain_interpolator
+        assert interpolator is not None
+        img = self.plot(mpl_vsec_styles.VS_TemperatureStyle_01(driver=self.vsec))
+        assert img is not None
+        assert self.vsec._curtain_interpolator is interpolator
+        self.path = self.path[:-1]
+        img = self.plot(mpl_vsec_styles.VS_TemperatureStyle_01(driver=self.vsec))
+        assert img is not None
+        assert self.vsec._curtain_interpolator is not interpolator
+
     def test_VS_GenericStyle(self):
         img = self.plot(mpl_vsec_styles.VS_GenericStyle_PL_mole_fraction_of_ozone_in_air(driver=self.vsec))
         assert img is not None
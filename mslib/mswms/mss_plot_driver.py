@@ -353,6 +353,11 @@ class VerticalSectionDriver(MSSPlotDriver):
     to be registered).
     """
 
+    def __init__(self, data_access_object):
+        super(VerticalSectionDriver, self).__init__(data_access_object)
+        self._curtain_interpolator_key = None
+        self._curtain_interpolator = None
+
     def set_plot_parameters(self, plot_object=None, vsec_path=None,
                             vsec_numpoints=101, vsec_path_connection='linear',
                             vsec_numlabels=10,
@@ -430,6 +435,19 @@ class VerticalSectionDriver(MSSPlotDriver):
         self.vsec_numpoints = vsec_numpoints
         self.vsec_path_connection = vsec_path_connection
 
+    def _get_curtain_interpolator(self, lon_data):
+        """
+        Returns the interpolator from the data grid to the points of the
+        section path. It is kept between plots and only rebuilt if the grid
+        or the path have changed.
+        """
+        grid_and_path = (self.lat_data, lon_data, self.lats, self.lons)
+        if self._curtain_interpolator_key is None or not all(
+                np.array_equal(_x, _y) for _x, _y in zip(self._curtain_interpolator_key, grid_and_path)):
+            self._curtain_interpolator_key = grid_and_path
+            self._curtain_interpolator = utils.BilinearCurtainInterpolator(*grid_and_path)
+        return self._curtain_interpolator
+
     def _load_interpolate_timestep(self):
         """
         Load and interpolate the data fields as required by the vertical
@@ -467,6 +485,7 @@ class VerticalSectionDriver(MSSPlotDriver):
         lon_data = ((self.lon_data - left_longitude) % 360) + left_longitude
         lon_indices = lon_data.argsort()
         lon_data = lon_data[lon_indices]
+        interpolator = self._get_curtain_interpolator(lon_data)
 
         for name, var in self.data_vars.items():
             if len(var.shape) == 4:
@@ -480,8 +499,7 @@ class VerticalSectionDriver(MSSPlotDriver):
             logging.debug("\tInterpolating to cross-section path.")
             # Re-arange longitude dimension in the data field.
             var_data = var_data[:, :, lon_indices]
-            data[name] = utils.interpolate_vertsec(var_data, self.lat_data, lon_data,
-                                                   self.lats, self.lons)
+            data[name] = interpolator(var_data)
             # Free memory.
             del var_data
 
@@ -771,6 +789,7 @@ class LinearSectionDriver(VerticalSectionDriver):
         lon_data = ((self.lon_data - left_longitude) % 360) + left_longitude
         lon_indices = lon_data.argsort()
         lon_data = lon_data[lon_indices]
+        interpolator = self._get_curtain_interpolator(lon_data)
         factors = []
 
         # Make sure air_pressure is the first to be evaluated
@@ -793,7 +812,7 @@ class LinearSectionDriver(VerticalSectionDriver):
             # Re-arange longitude dimension in the data field.
             var_data = var_data[:, :, lon_indices]
 
-            cross_section = utils.interpolate_vertsec(var_data, self.lat_data, lon_data, self.lats, self.lons)
+            cross_section = interpolator(var_data)
             # Create vertical interpolation factors and indices for subsequent variables
             # TODO: Improve performance for this interpolation in general
             if name == "air_pressure":
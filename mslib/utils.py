@@ -26,17 +26,18 @@
     limitations under the License.
 """
 
+import copy
 import datetime
+import functools
 import isodate
 import json
 import logging
+import math
 import netCDF4 as nc
 import numpy as np
 import os
 import pint
 from fs import open_fs, errors
-from scipy.interpolate import interp1d
-from scipy.ndimage import map_coordinates
 import subprocess
 import sys
 
@@ -92,6 +93,8 @@ UR.define("ppbv = 1e-9 fraction")
 UR.define("ppt = 1e-12 fraction")
 UR.define("pptv = 1e-12 fraction")
 
+_GEOD = pyproj.Geod(ellps="WGS84")
+
 
 def parse_iso_datetime(string):
     try:
@@ -125,20 +128,42 @@ def read_config_file(config_file=None):
     """
     user_config = {}
     if config_file is not None:
-        _dirname, _name = os.path.split(config_file)
-        _fs = open_fs(_dirname)
-        try:
-            with _fs.open(_name, 'r') as source:
-                user_config = json.load(source)
-        except errors.ResourceNotFound:
-            error_message = f"MSS config File '{config_file}' not found"
-            raise FatalUserError(error_message)
-        except ValueError as ex:
-            error_message = f"MSS config File '{config_file}' has a syntax error:\n\n'{ex}'"
-            raise FatalUserError(error_message)
+        user_config = copy.deepcopy(_load_config_file(config_file))
     return user_config
 
 
+def _load_config_file(config_file):
+    """
+    Returns the parsed content of a config file, which must not be modified.
+
+    Files given by a system path are only parsed again when their modification
+    time or size changed.
+    """
+    try:
+        if "://" in config_file:
+            _dirname, _name = os.path.split(config_file)
+            with open_fs(_dirname).open(_name, 'r') as source:
+                return json.load(source)
+        stat = os.stat(config_file)
+        return _read_json_file(config_file, stat.st_mtime_ns, stat.st_size)
+    except (errors.ResourceNotFound, FileNotFoundError):
+        error_message = f"MSS config File '{config_file}' not found"
+        raise FatalUserError(error_message)
+    except ValueError as ex:
+        error_message = f"MSS config File '{config_file}' has a syntax error:\n\n'{ex}'"
+        raise FatalUserError(error_message)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_json_file(json_file, modified, size):
+    """
+    Parses a json file. The modification time and size of the file are part of
+    the cache key, so that a changed file is read again.
+    """
+    with open(json_file) as source:
+        return json.load(source)
+
+
 def config_loader(config_file=None, dataset=None):
     """
     Function for loading json config data
@@ -162,11 +187,14 @@ def config_loader(config_file=None, dataset=None):
             return default_config
         else:
             return default_config[dataset]
-    user_config = read_config_file(config_file)
+    # only the returned part of the cached user config is copied
+    user_config = _load_config_file(config_file)
     if dataset is not None:
-        return user_config.get(dataset, default_config[dataset])
+        if dataset in user_config:
+            return copy.deepcopy(user_config[dataset])
+        return default_config[dataset]
     else:
-        default_config.update(user_config)
+        default_config.update(copy.deepcopy(user_config))
         return default_config
 
 
@@ -174,14 +202,18 @@ def get_distance(coord0, coord1):
     """
     Computes the distance between two points on the Earth surface
     Args:
-        coord0: coordinate(lat/lon) of first point
-        coord1: coordinate(lat/lon) of second point
+        coord0: coordinate(lat/lon) of first point or array of such coordinates
+        coord1: coordinate(lat/lon) of second point or array of such coordinates
+
+    Arrays of coordinates have the shape [..., 2] and are broadcast against each other.
 
     Returns:
-        length of distance in km
+        length of distance in km, an array for arrays of coordinates
     """
-    pr = pyproj.Geod(ellps='WGS84')
-    return (pr.inv(coord0[1], coord0[0], coord1[1], coord1[0])[-1] / 1000.)
+    if np.ndim(coord0) == 1 and np.ndim(coord1) == 1:
+        return _GEOD.inv(coord0[1], coord0[0], coord1[1], coord1[0])[-1] / 1000.
+    coord0, coord1 = np.broadcast_arrays(coord0, coord1)
+    return _GEOD.inv(coord0[..., 1], coord0[..., 0], coord1[..., 1], coord1[..., 0])[-1] / 1000.
 
 
 def find_location(lat, lon, tolerance=5):
@@ -256,11 +288,14 @@ def datetime_to_jsec(dt):
     """
     Calculate seconds since Jan 01 2000.
     """
-    delta = dt - JSEC_START
-    total = delta.days * 3600 * 24
-    total += delta.seconds
-    total += delta.microseconds * 1e-6
-    return total
+    return (dt - JSEC_START).total_seconds()
+
+
+def datetime_array_to_jsec(dts):
+    """
+    Calculate seconds since Jan 01 2000 for a sequence of datetimes.
+    """
+    return (np.asarray(dts, dtype="datetime64[us]") - np.datetime64(JSEC_START, "us")) / np.timedelta64(1, "s")
 
 
 def jsec_to_datetime(jsecs):
@@ -270,35 +305,69 @@ def jsec_to_datetime(jsecs):
     return JSEC_START + datetime.timedelta(seconds=jsecs)
 
 
+def jsec_array_to_datetime(jsecs):
+    """
+    Get the datetimes from a sequence of seconds since Jan 01 2000.
+
+    Returns a numpy datetime64 array with microsecond resolution.
+    """
+    return np.datetime64(JSEC_START, "us") + np.round(np.asarray(jsecs) * 1e6).astype("timedelta64[us]")
+
+
 def compute_hour_of_day(jsecs):
-    date = JSEC_START + datetime.timedelta(seconds=jsecs)
-    return date.hour + (date.minute / 60.) + (date.second / 3600.)
+    """
+    Get the hour of day from seconds since Jan 01 2000, works for numpy arrays as well.
+    """
+    return (jsecs % 86400.) / 3600.
 
 
 def fix_angle(ang):
     """
-    Normalizes an angle between -180 and 180 degree.
+    Normalizes an angle between 0 and 360 degree.
+    Works for scalars as well as numpy arrays.
     """
-    while ang > 360:
-        ang -= 360
-    while ang < 0:
-        ang += 360
-    return ang
+    return ang % 360
 
 
 def rotate_point(point, angle, origin=(0, 0)):
     """Rotates a point. Angle is in degrees.
     Rotation is counter-clockwise"""
-    angle = np.deg2rad(angle)
-    temp_point = ((point[0] - origin[0]) * np.cos(angle) -
-                  (point[1] - origin[1]) * np.sin(angle) + origin[0],
-                  (point[0] - origin[0]) * np.sin(angle) +
-                  (point[1] - origin[1]) * np.cos(angle) + origin[1])
+    angle = math.radians(angle)
+    cos_angle, sin_angle = math.cos(angle), math.sin(angle)
+    temp_point = ((point[0] - origin[0]) * cos_angle -
+                  (point[1] - origin[1]) * sin_angle + origin[0],
+                  (point[0] - origin[0]) * sin_angle +
+                  (point[1] - origin[1]) * cos_angle + origin[1])
     return temp_point
 
 
+def rotate_points(points, angle, origin=(0, 0)):
+    """Rotates a sequence of points by the same angle. Angle is in degrees.
+    Rotation is counter-clockwise
+
+    Returns the rotated points as Nx2 array."""
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    angle = math.radians(angle)
+    cos_angle, sin_angle = math.cos(angle), math.sin(angle)
+    delta_x, delta_y = points[:, 0] - origin[0], points[:, 1] - origin[1]
+    temp_points = np.empty_like(points)
+    temp_points[:, 0] = delta_x * cos_angle - delta_y * sin_angle + origin[0]
+    temp_points[:, 1] = delta_x * sin_angle + delta_y * cos_angle + origin[1]
+    return temp_points
+
+
+# constants of the barometric formula used by convertHPAToKM
+_HPA_SCALE = 288.15 / 0.0065 / 1000.
+_HPA_REF = 1013.25
+_HPA_EXP = 1. / 5.255
+
+
 def convertHPAToKM(press):
-    return (288.15 / 0.0065) * (1. - (press / 1013.25) ** (1. / 5.255)) / 1000.
+    """
+    Converts pressure in hPa to altitude in km. press may be a scalar or an
+    array (also a masked one) of pressures.
+    """
+    return _HPA_SCALE * (1. - (np.asanyarray(press) / _HPA_REF) ** _HPA_EXP)
 
 
 def get_projection_params(proj):
@@ -424,35 +493,78 @@ def get_projection_params(proj):
     return proj_params
 
 
+def _bilinear_axis_weights(axis, values):
+    """
+    Determines for each value the two enclosing points of a coordinate axis
+    and the fractional distance of the value to the first one.
+
+    The axis does not need to be sorted. Values outside of the axis range are
+    flagged as invalid.
+
+    Returns the indices of the lower and upper points, the fractions and the
+    validity flags.
+    """
+    axis = np.asarray(axis)
+    values = np.asarray(values)
+    order = np.argsort(axis)
+    sorted_axis = axis[order]
+    # fractional indices into the sorted axis, NaN outside of its range
+    position = np.interp(values, sorted_axis, np.arange(len(sorted_axis)), left=np.nan, right=np.nan)
+    valid = ~np.isnan(position)
+    position = np.where(valid, position, 0)
+    idx = np.clip(np.floor(position).astype(int), 0, len(sorted_axis) - 2)
+    return order[idx], order[idx + 1], position - idx, valid
+
+
+class BilinearCurtainInterpolator(object):
+    """
+    Interpolates curtains[level, pos] from fields data3D[level, lat, lon]
+    given on the grid data3D_lats, data3D_lons to the positions lats, lons.
+
+    The bilinear interpolation weights are computed once on construction.
+    Calling the instance applies them to all levels of a field in one
+    vectorized step, so one instance serves all fields on the same grid.
+    """
+
+    def __init__(self, data3D_lats, data3D_lons, lats, lons):
+        i0, i1, fy, valid_lats = _bilinear_axis_weights(data3D_lats, lats)
+        j0, j1, fx, valid_lons = _bilinear_axis_weights(data3D_lons, lons)
+
+        # Indices of the four corners of the enclosing grid cells within the
+        # flattened horizontal plane, shaped [4, pos], and the fractional
+        # positions within the cells along lat and lon, shaped [2, pos].
+        # Positions outside of the grid get NaN fractions, so that their curtain
+        # values come out as NaN without any extra masking step.
+        nlons = len(data3D_lons)
+        self.indices = np.stack([i0 * nlons + j0, i0 * nlons + j1, i1 * nlons + j0, i1 * nlons + j1])
+        self.fractions = np.where(valid_lats & valid_lons, [fy, fx], np.nan)
+
+    def __call__(self, data3D):
+        # Gather all corners of all model levels in one go and blend them
+        # along lon and then along lat. Blending by differences reproduces
+        # constant fields exactly. Single precision fields are blended with
+        # single precision fractions and thus not promoted to double precision.
+        corners = np.ma.filled(data3D.reshape(data3D.shape[0], -1)[:, self.indices], np.nan)
+        fy, fx = self.fractions.astype(np.result_type(corners, np.float32), copy=False)
+        upper = corners[:, 0] + fx * (corners[:, 1] - corners[:, 0])
+        lower = corners[:, 2] + fx * (corners[:, 3] - corners[:, 2])
+        curtain = upper + fy * (lower - upper)
+        return np.ma.masked_invalid(curtain)
+
+
 def interpolate_vertsec(data3D, data3D_lats, data3D_lons, lats, lons):
     """
     Interpolate curtain[z,pos] (curtain[level,pos]) from data3D[z,y,x]
     (data3D[level,lat,lon]).
 
-    This method is based on scipy.ndimage.map_coordinates().
+    The curtain is computed by bilinear interpolation, see
+    BilinearCurtainInterpolator, which should be used directly to
+    interpolate several fields defined on the same grid.
 
     data3D can be on an IRREGULAR lat/lon grid, coordinates given by lats, lons.
     The lats, lons arrays can have arbitrary order, they do not have to be uniform.
     """
-    # Create an empty field to accommodate the curtain.
-    curtain = np.zeros([data3D.shape[0], len(lats)])
-
-    # Transform lat/lon values to array index space. This is necessary to use
-    # scipy.ndimage.map_coordinates().
-    interp_lat = interp1d(data3D_lats, np.arange(len(data3D_lats)), bounds_error=False)
-    ind_lats = interp_lat(lats)
-    interp_lon = interp1d(data3D_lons, np.arange(len(data3D_lons)), bounds_error=False)
-    ind_lons = interp_lon(lons)
-    ind_coords = np.array([ind_lats, ind_lons])
-
-    # One horizontal interpolation for each model level. The order
-    # parameter controls the degree of the splines used, i.e. order=1
-    # stands for linear interpolation.
-    for ml in range(data3D.shape[0]):
-        curtain[ml, :] = map_coordinates(data3D[ml, :, :].filled(np.nan), ind_coords, order=1)
-
-    curtain[:, np.isnan(ind_lats) | np.isnan(ind_lons)] = np.nan
-    return np.ma.masked_invalid(curtain)
+    return BilinearCurtainInterpolator(data3D_lats, data3D_lons, lats, lons)(data3D)
 
 
 def latlon_points(p1, p2, numpoints=100, connection='linear', contains_altitude=False):
@@ -478,8 +590,7 @@ def latlon_points(p1, p2, numpoints=100, connection='linear', contains_altitude=
         lons = np.linspace(p1[LON], p2[LON], numpoints)
     elif connection == 'greatcircle':
         if numpoints > 2:
-            gc = pyproj.Geod(ellps="WGS84")
-            pts = gc.npts(p1[LON], p1[LAT], p2[LON], p2[LAT], numpoints - 2)
+            pts = _GEOD.npts(p1[LON], p1[LAT], p2[LON], p2[LAT], numpoints - 2)
             lats = np.asarray([p1[LAT]] + [_x[1] for _x in pts] + [p2[LAT]])
             lons = np.asarray([p1[LON]] + [_x[0] for _x in pts] + [p2[LON]])
         else:
@@ -522,17 +633,13 @@ def path_points(points, numpoints=100, connection='linear', contains_altitude=Fa
 
     # First compute the lengths of the individual path segments, i.e.
     # the distances between the points.
-    distances = []
-    for i in range(len(points) - 1):
-        if connection == 'linear':
-            # Use Euclidean distance in lat/lon space.
-            d = np.hypot(points[i][LAT] - points[i + 1][LAT],
-                         points[i][LON] - points[i + 1][LON])
-        elif connection == 'greatcircle':
-            # Use Vincenty distance provided by the geopy module.
-            d = get_distance(points[i], points[i + 1])
-        distances.append(d)
-    distances = np.asarray(distances)
+    coords = np.array([(point[LAT], point[LON]) for point in points], dtype=float)
+    if connection == 'linear':
+        # Use Euclidean distance in lat/lon space.
+        distances = np.hypot(*np.diff(coords, axis=0).T)
+    elif connection == 'greatcircle':
+        # Use geodesic distance on the WGS84 ellipsoid.
+        distances = get_distance(coords[:-1], coords[1:])
 
     # Compute the total length of the path and the length of the point
     # segments to be computed.